@@ -11,6 +11,8 @@ from .constraints import (
     NoInstructorOverlap,
     NoRoomOverlap,
     RoomCapacity,
+    BreakRoomSymmetry,
+    BreakTimeSlotSymmetry,
     ForceRooms,
     ForceTimeSlots,
 )
@@ -27,6 +29,8 @@ __all__ = [
     "NoInstructorOverlap",
     "NoRoomOverlap",
     "RoomCapacity",
+    "BreakRoomSymmetry",
+    "BreakTimeSlotSymmetry",
     "ForceRooms",
     "ForceTimeSlots",
     # Utilities
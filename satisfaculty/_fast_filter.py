@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Compiled key-filtering kernels.
+
+Keys are encoded once as integer ids and SWAR-packed into a single
+uint64 per key (20 bits each for course, room, and time slot), so hot
+filters run as a branchless masked compare over one contiguous array
+instead of calling a Python predicate per key. When numba is installed
+the kernels are JIT-compiled; otherwise the NumPy fallbacks are used,
+which are already vectorized.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# Field layout of a packed key: course | room | slot, 20 bits each
+COURSE_SHIFT = np.uint64(40)
+ROOM_SHIFT = np.uint64(20)
+FIELD_MASK = np.uint64((1 << 20) - 1)
+
+
+def pack_keys(course_ids, room_ids, slot_ids):
+    """Pack per-key id columns into a single uint64 array."""
+    return (
+        (course_ids.astype(np.uint64) << COURSE_SHIFT)
+        | (room_ids.astype(np.uint64) << ROOM_SHIFT)
+        | slot_ids.astype(np.uint64)
+    )
+
+
+def pack_query(course_id=None, room_id=None, slot_id=None):
+    """
+    Build a (query_mask, query_value) pair for packed-key matching.
+
+    Fields left as None are "don't care": the mask zeroes them out so
+    (packed & query_mask) == query_value matches any value there.
+    """
+    query_mask = np.uint64(0)
+    query_value = np.uint64(0)
+    if course_id is not None:
+        query_mask |= FIELD_MASK << COURSE_SHIFT
+        query_value |= np.uint64(course_id) << COURSE_SHIFT
+    if room_id is not None:
+        query_mask |= FIELD_MASK << ROOM_SHIFT
+        query_value |= np.uint64(room_id) << ROOM_SHIFT
+    if slot_id is not None:
+        query_mask |= FIELD_MASK
+        query_value |= np.uint64(slot_id)
+    return query_mask, query_value
+
+
+def _packed_match_py(key_packed, query_mask, query_value):
+    return (key_packed & query_mask) == query_value
+
+
+def _slot_overlap_matrix_py(start_min, end_min, day_mask, buffer_minutes):
+    days_overlap = (day_mask[:, None] & day_mask[None, :]) != 0
+    time_overlap = (
+        (start_min[None, :] <= start_min[:, None])
+        & (end_min[None, :] > start_min[:, None] - buffer_minutes)
+    )
+    return days_overlap & time_overlap
+
+
+if njit is not None:
+    @njit(cache=True)
+    def _packed_match_jit(key_packed, query_mask, query_value):
+        n = key_packed.size
+        out = np.empty(n, dtype=np.bool_)
+        for i in range(n):
+            out[i] = (key_packed[i] & query_mask) == query_value
+        return out
+
+    @njit(cache=True)
+    def _slot_overlap_matrix_jit(start_min, end_min, day_mask, buffer_minutes):
+        n = start_min.size
+        out = np.empty((n, n), dtype=np.bool_)
+        for i in range(n):
+            cutoff = start_min[i] - buffer_minutes
+            for j in range(n):
+                out[i, j] = (
+                    (day_mask[i] & day_mask[j]) != 0
+                    and start_min[j] <= start_min[i]
+                    and end_min[j] > cutoff
+                )
+        return out
+
+    packed_match = _packed_match_jit
+    slot_overlap_matrix = _slot_overlap_matrix_jit
+else:
+    packed_match = _packed_match_py
+    slot_overlap_matrix = _slot_overlap_matrix_py
+
+packed_match.__doc__ = """
+Mask of packed keys matching a (query_mask, query_value) pair from pack_query.
+"""
+
+slot_overlap_matrix.__doc__ = """
+Boolean matrix of the slot-overlap relation.
+
+out[i, j] is True when slot j shares a day with slot i, starts no later
+than slot i, and ends after slot i's start minus the buffer.
+
+Args:
+    start_min: int32 array of slot start times (minutes since midnight)
+    end_min: int32 array of slot end times
+    day_mask: uint8 array of day bitmasks
+    buffer_minutes: minutes before a slot's start that still overlap
+
+Returns:
+    (n, n) boolean array
+"""
@@ -0,0 +1,25 @@
+#!/usr/bin/env python3
+"""
+Fast construction helpers for PuLP expressions.
+
+``lpSum`` builds its result by repeatedly adding terms, allocating a temporary
+``LpAffineExpression`` per step; comparison operators like ``==`` and ``<=``
+then copy the expression again. Feeding ``(variable, coefficient)`` pairs
+straight into the ``LpAffineExpression`` constructor builds the internal dict
+in a single pass, which is several times faster on large models.
+"""
+
+from pulp import LpAffineExpression
+
+
+def affine(pairs):
+    """
+    Build an LpAffineExpression from (variable, coefficient) pairs.
+
+    Args:
+        pairs: Iterable of (LpVariable, numeric coefficient) tuples
+
+    Returns:
+        LpAffineExpression with the given terms
+    """
+    return LpAffineExpression(pairs)
@@ -6,7 +6,8 @@ Constraints are added to the problem before optimization and define
 the feasibility requirements for valid schedules.
 """
 
-from abc import ABC, abstractmethod
+from abc import ABC
+from typing import Dict, Optional
 
 
 class ConstraintBase(ABC):
@@ -15,9 +16,19 @@ class ConstraintBase(ABC):
 
     Each constraint has:
     - A name for logging/debugging
-    - An apply() method that adds constraints to the LP problem
+    - A build() method producing its constraint block, or an overridden
+      apply() that adds constraints to the LP problem directly
     """
 
+    #: True if build() only reads scheduler state, so this constraint's
+    #: block can be built concurrently with other parallel-safe blocks
+    parallel_safe = False
+
+    #: True if this constraint's rows may be added lazily: its block can
+    #: be rebuilt after a solve and only the violated rows appended (see
+    #: InstructorScheduler.optimize_schedule's row_generation option)
+    supports_row_generation = False
+
     def __init__(self, name: str):
         """
         Initialize a constraint.
@@ -27,7 +38,23 @@ class ConstraintBase(ABC):
         """
         self.name = name
 
-    @abstractmethod
+    def build(self, scheduler) -> Optional[Dict]:
+        """
+        Build this constraint's block without touching the problem.
+
+        Constraints that implement build() get apply() for free, and the
+        scheduler may build their blocks concurrently when parallel_safe
+        is True.
+
+        Args:
+            scheduler: InstructorScheduler instance with problem setup
+
+        Returns:
+            Dict mapping constraint names to LpConstraint objects, or
+            None if this constraint only overrides apply() directly
+        """
+        return None
+
     def apply(self, scheduler) -> int:
         """
         Apply this constraint to the scheduler's LP problem.
@@ -44,7 +71,13 @@ class ConstraintBase(ABC):
         Returns:
             Number of constraints added to the problem
         """
-        pass
+        constraints = self.build(scheduler)
+        if constraints is None:
+            raise NotImplementedError(
+                f"{type(self).__name__} must implement build() or override apply()"
+            )
+        scheduler.prob.extend(constraints)
+        return len(constraints)
 
     def __repr__(self):
         return f"{self.__class__.__name__}(name='{self.name}')"
@@ -5,135 +5,323 @@ Core constraint classes for schedule optimization.
 These define the feasibility requirements that all valid schedules must satisfy.
 """
 
-import pandas as pd
+from __future__ import annotations
+
+import functools
+import os
+
+import numpy as np
+from typing import TYPE_CHECKING, Optional
+
+from pulp import LpConstraint, LpConstraintEQ, LpConstraintLE
+
+if TYPE_CHECKING:
+    import pandas as pd
 from .constraint_base import ConstraintBase
-from pulp import lpSum
-from .scheduler import filter_keys
+from ._pulp_fast import affine
 
 
 class AssignAllCourses(ConstraintBase):
     """Ensures each course is scheduled exactly once."""
 
+    parallel_safe = True
+
     def __init__(self):
         super().__init__(name="Assign all courses")
 
-    def apply(self, scheduler) -> int:
-        count = 0
+    def build(self, scheduler) -> dict:
+        constraints = {}
         for course in scheduler.courses:
-            scheduler.prob += (
-                lpSum(scheduler.x[k] for k in filter_keys(scheduler.keys, course=course)) == 1,
-                f"assign_course_{course}"
+            name = f"assign_course_{course}"
+            constraints[name] = LpConstraint(
+                affine((scheduler.x[k], 1) for k in scheduler.keys_by_course[course]),
+                sense=LpConstraintEQ, rhs=1, name=name
             )
-            count += 1
-        return count
+        return constraints
 
 
 class NoInstructorOverlap(ConstraintBase):
     """Ensures an instructor can only teach one course at a time."""
 
+    parallel_safe = True
+    supports_row_generation = True
+
     def __init__(self):
         super().__init__(name="No instructor overlap")
 
-    def apply(self, scheduler) -> int:
-        count = 0
+    def build(self, scheduler) -> dict:
+        constraints = {}
         for instructor in scheduler.instructors:
             for t in scheduler.time_slots:
-                scheduler.prob += (
-                    lpSum(
-                        scheduler.x[k] * scheduler.a[(instructor, k[0])]
-                        for k in filter_keys(scheduler.keys, predicate=scheduler.make_overlap_predicate(t))
-                    ) <= 1,
-                    f"no_instructor_overlap_{instructor}_{t}"
+                terms = [
+                    k
+                    for ts in scheduler.overlapping_slots[t]
+                    for k in scheduler.keys_by_instructor_time.get((instructor, ts), ())
+                ]
+                # A sum of <= 1 binaries is trivially <= 1; emitting the row
+                # would only bloat the LP file the solver has to parse
+                if len(terms) <= 1:
+                    continue
+                name = f"no_instructor_overlap_{instructor}_{t}"
+                constraints[name] = LpConstraint(
+                    affine((scheduler.x[k], 1) for k in terms),
+                    sense=LpConstraintLE, rhs=1, name=name
                 )
-                count += 1
-        return count
+        return constraints
 
 
 class NoRoomOverlap(ConstraintBase):
     """Ensures a room can only host one course at a time."""
 
+    parallel_safe = True
+    supports_row_generation = True
+
     def __init__(self):
         super().__init__(name="No room overlap")
 
-    def apply(self, scheduler) -> int:
-        count = 0
+    def build(self, scheduler) -> dict:
+        constraints = {}
         for room in scheduler.rooms:
             for t in scheduler.time_slots:
-                scheduler.prob += (
-                    lpSum(
-                        scheduler.x[k] for k in filter_keys(
-                            scheduler.keys,
-                            predicate=scheduler.make_overlap_predicate(t, room=room)
-                        )
-                    ) <= 1,
-                    f"no_room_overlap_{room}_{t}"
+                terms = scheduler.overlap_keys_by_room_time.get((room, t), ())
+                # A sum of <= 1 binaries is trivially <= 1; emitting the row
+                # would only bloat the LP file the solver has to parse
+                if len(terms) <= 1:
+                    continue
+                name = f"no_room_overlap_{room}_{t}"
+                constraints[name] = LpConstraint(
+                    affine((scheduler.x[k], 1) for k in terms),
+                    sense=LpConstraintLE, rhs=1, name=name
                 )
-                count += 1
-        return count
+        return constraints
 
 
 class RoomCapacity(ConstraintBase):
     """Ensures room capacity is not exceeded by course enrollment."""
 
+    parallel_safe = True
+    supports_row_generation = True
+
     def __init__(self):
         super().__init__(name="Room capacity")
 
-    def apply(self, scheduler) -> int:
-        count = 0
+    def build(self, scheduler) -> dict:
+        constraints = {}
+        # When NoRoomOverlap is also in force, at most one course can be
+        # active per (room, time_slot), so a capacity row is redundant
+        # whenever every candidate course fits the room on its own — the
+        # overlap row already dominates it
+        dominated_by_overlap = any(
+            isinstance(c, NoRoomOverlap) for c in scheduler._constraints
+        )
+        # keys_by_room_time already groups the keys by (room, time_slot),
+        # so iterate the non-empty groups directly instead of the full
+        # rooms x time_slots cross product; (room, t) pairs with no
+        # candidate keys contribute nothing but a vacuous 0 <= capacity row
+        for (room, t), group in scheduler.keys_by_room_time.items():
+            capacity = scheduler.capacities[room]
+            if dominated_by_overlap and max(
+                scheduler.enrollments[k[0]] for k in group
+            ) <= capacity:
+                continue
+            name = f"room_capacity_{room}_{t}"
+            constraints[name] = LpConstraint(
+                affine((scheduler.x[k], scheduler.enrollments[k[0]]) for k in group),
+                sense=LpConstraintLE, rhs=capacity, name=name
+            )
+        return constraints
+
+
+class BreakRoomSymmetry(ConstraintBase):
+    """
+    Breaks symmetry between rooms of equal capacity.
+
+    Equal-capacity rooms are interchangeable to the feasibility
+    constraints, so the solver would otherwise branch over every
+    permutation of assignments across them. Within each capacity class,
+    in room-data order, each room is constrained to host no more courses
+    in total than the room before it, which picks one representative out
+    of each family of permuted solutions.
+
+    Do not combine this with anything that distinguishes rooms within a
+    class — a ForceRooms entry or a MaximizePreferredRooms objective
+    naming one of two equal-capacity rooms — since the ordering can then
+    cut off the preferred optimum.
+    """
+
+    parallel_safe = True
+
+    def __init__(self):
+        super().__init__(name="Break room symmetry")
+
+    def build(self, scheduler) -> dict:
+        by_capacity: dict = {}
         for room in scheduler.rooms:
-            for t in scheduler.time_slots:
-                scheduler.prob += (
-                    lpSum(
-                        scheduler.x[k] * scheduler.enrollments[k[0]]
-                        for k in filter_keys(scheduler.keys, room=room, time_slot=t)
-                    ) <= scheduler.capacities[room],
-                    f"room_capacity_{room}_{t}"
+            by_capacity.setdefault(scheduler.capacities[room], []).append(room)
+        constraints = {}
+        for rooms in by_capacity.values():
+            for r_prev, r_next in zip(rooms, rooms[1:]):
+                later = scheduler.keys_by_room.get(r_next, ())
+                if not later:
+                    continue
+                earlier = scheduler.keys_by_room.get(r_prev, ())
+                name = f"room_symmetry_{r_prev}_{r_next}"
+                terms = [(scheduler.x[k], 1) for k in later]
+                terms += [(scheduler.x[k], -1) for k in earlier]
+                constraints[name] = LpConstraint(
+                    affine(terms), sense=LpConstraintLE, rhs=0, name=name
                 )
-                count += 1
-        return count
+        return constraints
+
+
+class BreakTimeSlotSymmetry(ConstraintBase):
+    """
+    Breaks symmetry between interchangeable time slots of the same type.
+
+    Slots of one Type admit the same (course, room) candidates, but they
+    are only truly interchangeable when they also conflict with every
+    slot in exactly the same way — otherwise swapping assignments across
+    them changes which overlap rows bind. So slots are grouped by Type
+    plus their row and column of the slot-overlap relation, and within
+    each group, in slot-data order, each slot is constrained to host no
+    more courses in total than the slot before it.
+
+    Do not combine this with anything that distinguishes slots within a
+    group — a ForceTimeSlots entry or a MinimizeClassesBefore/After
+    objective — since the ordering can then cut off the preferred
+    optimum.
+    """
+
+    parallel_safe = True
+
+    def __init__(self):
+        super().__init__(name="Break time slot symmetry")
+
+    def build(self, scheduler) -> dict:
+        mask = scheduler.overlap_slot_mask
+        slots = scheduler.time_slots
+        groups: dict = {}
+        for i, t in enumerate(slots):
+            groups.setdefault(scheduler.slot_types[t], []).append(i)
+        constraints = {}
+        for members in groups.values():
+            # Partition the type group into classes with identical
+            # overlap profiles (ignoring the pair's own entries, which
+            # the swap maps onto each other)
+            classes: list = []
+            for i in members:
+                for cls in classes:
+                    j = cls[0]
+                    keep = np.ones(len(slots), dtype=bool)
+                    keep[[i, j]] = False
+                    if (
+                        mask[i, j] == mask[j, i]
+                        and np.array_equal(mask[i, keep], mask[j, keep])
+                        and np.array_equal(mask[keep, i], mask[keep, j])
+                    ):
+                        cls.append(i)
+                        break
+                else:
+                    classes.append([i])
+            for cls in classes:
+                for i_prev, i_next in zip(cls, cls[1:]):
+                    t_prev, t_next = slots[i_prev], slots[i_next]
+                    later = scheduler.keys_by_time_slot.get(t_next, ())
+                    if not later:
+                        continue
+                    earlier = scheduler.keys_by_time_slot.get(t_prev, ())
+                    name = f"time_slot_symmetry_{t_prev}_{t_next}"
+                    terms = [(scheduler.x[k], 1) for k in later]
+                    terms += [(scheduler.x[k], -1) for k in earlier]
+                    constraints[name] = LpConstraint(
+                        affine(terms), sense=LpConstraintLE, rhs=0, name=name
+                    )
+        return constraints
+
+
+@functools.lru_cache(maxsize=None)
+def _read_csv_cached(filename: str, mtime: float, columns: Optional[tuple] = None) -> pd.DataFrame:
+    """
+    Read a CSV once per (filename, mtime); repeated applies reuse it.
+
+    When a column subset is given, only those columns are parsed, via
+    pyarrow's reader when available (substantially faster on large files).
+    """
+    # Deferred so importing this module doesn't pay for pandas; only the
+    # force constraints actually need it
+    import pandas as pd
+
+    if columns is not None:
+        try:
+            import pyarrow.csv as pacsv
+        except ImportError:
+            return pd.read_csv(filename, usecols=list(columns))
+        convert_options = pacsv.ConvertOptions(include_columns=list(columns))
+        return pacsv.read_csv(filename, convert_options=convert_options).to_pandas()
+    return pd.read_csv(filename)
+
+
+def _force_dataframe(constraint, scheduler) -> pd.DataFrame:
+    """Resolve the DataFrame a Force* constraint should read from."""
+    if constraint.dataframe is not None:
+        return constraint.dataframe
+    if constraint.filename is not None:
+        return _read_csv_cached(constraint.filename, os.path.getmtime(constraint.filename),
+                                columns=('Course', constraint.column))
+    # Default: the course data the scheduler already loaded, avoiding a
+    # redundant re-parse of courses.csv on every apply
+    return scheduler.courses_df
 
 
 class ForceRooms(ConstraintBase):
     """Forces specific courses to be assigned to specific rooms."""
 
-    def __init__(self, filename: str = 'courses.csv', column: str = 'Force Room'):
+    parallel_safe = True
+
+    def __init__(self, filename: Optional[str] = None, column: str = 'Force Room',
+                 dataframe: Optional[pd.DataFrame] = None):
         self.filename = filename
         self.column = column
+        self.dataframe = dataframe
         super().__init__(name=f"Force rooms ({column})")
 
-    def apply(self, scheduler) -> int:
-        df = pd.read_csv(self.filename)
-        count = 0
-        for _, row in df.iterrows():
-            course = row['Course']
-            forced_room = row[self.column]
-            if pd.notna(forced_room) and forced_room != '':
-                scheduler.prob += (
-                    lpSum(scheduler.x[k] for k in filter_keys(scheduler.keys, course=course, room=forced_room)) == 1,
-                    f"force_room_{course}"
-                )
-                count += 1
-        return count
+    def build(self, scheduler) -> dict:
+        df = _force_dataframe(self, scheduler)
+        # Select the forced rows with a vectorized mask; only the (usually
+        # few) matching rows are visited in Python
+        mask = df[self.column].notna() & (df[self.column] != '')
+        constraints = {}
+        for course, forced_room in df.loc[mask, ['Course', self.column]].to_numpy():
+            name = f"force_room_{course}"
+            constraints[name] = LpConstraint(
+                affine((scheduler.x[k], 1) for k in scheduler.keys_by_course_room.get((course, forced_room), ())),
+                sense=LpConstraintEQ, rhs=1, name=name
+            )
+        return constraints
 
 
 class ForceTimeSlots(ConstraintBase):
     """Forces specific courses to be assigned to specific time slots."""
 
-    def __init__(self, filename: str = 'courses.csv', column: str = 'Force Time Slot'):
+    parallel_safe = True
+
+    def __init__(self, filename: Optional[str] = None, column: str = 'Force Time Slot',
+                 dataframe: Optional[pd.DataFrame] = None):
         self.filename = filename
         self.column = column
+        self.dataframe = dataframe
         super().__init__(name=f"Force time slots ({column})")
 
-    def apply(self, scheduler) -> int:
-        df = pd.read_csv(self.filename)
-        count = 0
-        for _, row in df.iterrows():
-            course = row['Course']
-            forced_slot = row[self.column]
-            if pd.notna(forced_slot) and forced_slot != '':
-                scheduler.prob += (
-                    lpSum(scheduler.x[k] for k in filter_keys(scheduler.keys, course=course, time_slot=forced_slot)) == 1,
-                    f"force_time_slot_{course}"
-                )
-                count += 1
-        return count
+    def build(self, scheduler) -> dict:
+        df = _force_dataframe(self, scheduler)
+        # Select the forced rows with a vectorized mask; only the (usually
+        # few) matching rows are visited in Python
+        mask = df[self.column].notna() & (df[self.column] != '')
+        constraints = {}
+        for course, forced_slot in df.loc[mask, ['Course', self.column]].to_numpy():
+            name = f"force_time_slot_{course}"
+            constraints[name] = LpConstraint(
+                affine((scheduler.x[k], 1) for k in scheduler.keys_by_course_time.get((course, forced_slot), ())),
+                sense=LpConstraintEQ, rhs=1, name=name
+            )
+        return constraints
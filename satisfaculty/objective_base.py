@@ -6,22 +6,29 @@ Objectives are optimized in order of priority, with each objective's
 optimal value becoming a constraint for subsequent objectives.
 """
 
-from abc import ABC, abstractmethod
 from pulp import LpAffineExpression
 from typing import Literal
 
 
-class ObjectiveBase(ABC):
+class ObjectiveBase:
     """
-    Abstract base class for optimization objectives.
+    Base class for optimization objectives.
 
     Each objective has:
     - A name for logging/debugging
     - A sense (minimize or maximize)
     - A tolerance for lexicographic constraints (allows some slack)
     - An evaluate() method that returns a PuLP expression
+
+    Subclasses are validated once at class-creation time instead of
+    carrying ABCMeta's per-instance machinery.
     """
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if cls.evaluate is ObjectiveBase.evaluate:
+            raise TypeError(f"{cls.__name__} must override evaluate()")
+
     def __init__(
         self,
         name: str,
@@ -48,7 +55,6 @@ class ObjectiveBase(ABC):
         if tolerance < 0:
             raise ValueError(f"tolerance must be non-negative, got {tolerance}")
 
-    @abstractmethod
     def evaluate(self, scheduler) -> LpAffineExpression:
         """
         Evaluate this objective for the given scheduler.
@@ -64,7 +70,27 @@ class ObjectiveBase(ABC):
         Returns:
             PuLP expression to optimize (minimize or maximize based on self.sense)
         """
-        pass
+        raise NotImplementedError
+
+    def precheck(self, scheduler) -> LpAffineExpression:
+        """
+        Build this objective's expression and sanity-check it.
+
+        Warns when the objective selects no variables at all — usually a
+        misspelled instructor, room, or course type — since such an
+        objective silently optimizes a constant. Returns the expression
+        so callers can reuse it instead of evaluating twice.
+
+        Args:
+            scheduler: InstructorScheduler instance with problem setup
+
+        Returns:
+            The result of evaluate(scheduler)
+        """
+        expr = self.evaluate(scheduler)
+        if len(expr) == 0:
+            print(f"Warning: objective '{self.name}' matches no scheduling keys")
+        return expr
 
     def __repr__(self):
         return f"{self.__class__.__name__}(name='{self.name}', sense='{self.sense}', tolerance={self.tolerance})"
@@ -6,9 +6,10 @@ These demonstrate common scheduling objectives that can be combined
 in different orders to create customized optimization strategies.
 """
 
+import numpy as np
+
 from .objective_base import ObjectiveBase
-from pulp import lpSum
-from .scheduler import filter_keys
+from ._pulp_fast import affine
 from .utils import time_to_minutes
 from typing import Optional, List
 
@@ -50,24 +51,11 @@ class MinimizeClassesBefore(ObjectiveBase):
         )
 
     def evaluate(self, scheduler):
-        def matches_criteria(course, room, time_slot):
-            # Check time constraint
-            slot_start = scheduler.slot_start_minutes[time_slot]
-            if slot_start >= self.time_minutes:
-                return False
-
-            # Check instructor constraint
-            if self.instructor:
-                course_instructor = scheduler.courses_df[
-                    scheduler.courses_df['Course'] == course
-                ]['Instructor'].values[0]
-                if course_instructor != self.instructor:
-                    return False
-
-            return True
+        mask = scheduler.key_slot_start < self.time_minutes
+        if self.instructor:
+            mask &= scheduler.key_instructor == self.instructor
 
-        filtered = filter_keys(scheduler.keys, predicate=matches_criteria)
-        return lpSum(scheduler.x[k] for k in filtered)
+        return affine((v, 1) for v in scheduler.x_arr[mask])
 
 
 class MinimizeClassesAfter(ObjectiveBase):
@@ -111,29 +99,13 @@ class MinimizeClassesAfter(ObjectiveBase):
         )
 
     def evaluate(self, scheduler):
-        def matches_criteria(course, room, time_slot):
-            # Check time constraint
-            slot_start = scheduler.slot_start_minutes[time_slot]
-            if slot_start <= self.time_minutes:
-                return False
-
-            # Check instructor constraint
-            if self.instructor:
-                course_instructor = scheduler.courses_df[
-                    scheduler.courses_df['Course'] == course
-                ]['Instructor'].values[0]
-                if course_instructor != self.instructor:
-                    return False
-
-            # Check course type constraint
-            if self.course_type:
-                if scheduler.course_types[course] != self.course_type:
-                    return False
-
-            return True
+        mask = scheduler.key_slot_start > self.time_minutes
+        if self.instructor:
+            mask &= scheduler.key_instructor == self.instructor
+        if self.course_type:
+            mask &= scheduler.key_course_type == self.course_type
 
-        filtered = filter_keys(scheduler.keys, predicate=matches_criteria)
-        return lpSum(scheduler.x[k] for k in filtered)
+        return affine((v, 1) for v in scheduler.x_arr[mask])
 
 
 class MaximizePreferredRooms(ObjectiveBase):
@@ -161,6 +133,8 @@ class MaximizePreferredRooms(ObjectiveBase):
         self.preferred_rooms = set(preferred_rooms)
         self.instructor = instructor
         self.course_type = course_type
+        self._pref_mask = None
+        self._pref_mask_source = None
 
         name_parts = [f"preferred rooms ({', '.join(preferred_rooms)})"]
         if instructor:
@@ -175,25 +149,16 @@ class MaximizePreferredRooms(ObjectiveBase):
         )
 
     def evaluate(self, scheduler):
-        def matches_criteria(course, room, time_slot):
-            # Check room constraint
-            if room not in self.preferred_rooms:
-                return False
-
-            # Check instructor constraint
-            if self.instructor:
-                course_instructor = scheduler.courses_df[
-                    scheduler.courses_df['Course'] == course
-                ]['Instructor'].values[0]
-                if course_instructor != self.instructor:
-                    return False
-
-            # Check course type constraint
-            if self.course_type:
-                if scheduler.course_types[course] != self.course_type:
-                    return False
-
-            return True
-
-        filtered = filter_keys(scheduler.keys, predicate=matches_criteria)
-        return lpSum(scheduler.x[k] for k in filtered)
+        # The preferred-room mask is static for a given problem setup, so
+        # cache it across lexicographic rounds; key_room is rebuilt on each
+        # setup_problem, so its identity tells us when to recompute
+        if self._pref_mask_source is not scheduler.key_room:
+            self._pref_mask = np.isin(scheduler.key_room, list(self.preferred_rooms))
+            self._pref_mask_source = scheduler.key_room
+        mask = self._pref_mask
+        if self.instructor:
+            mask = mask & (scheduler.key_instructor == self.instructor)
+        if self.course_type:
+            mask = mask & (scheduler.key_course_type == self.course_type)
+
+        return affine((v, 1) for v in scheduler.x_arr[mask])
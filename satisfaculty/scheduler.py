@@ -4,13 +4,18 @@ Instructor Scheduling System with Integer Linear Programming
 Optimizes assignment of instructors to rooms considering capacity constraints.
 """
 
+import os
+
 import pandas as pd
 import numpy as np
 from pulp import *
 import csv
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Tuple, Optional, Callable, Iterable
 from .visualize_schedule import visualize_schedule
-from .utils import time_to_minutes, expand_days
+from ._fast_filter import pack_keys, pack_query, packed_match, slot_overlap_matrix
+from .utils import expand_days, days_to_bits
 from .objective_base import ObjectiveBase
 from .constraint_base import ConstraintBase
 
@@ -24,7 +29,8 @@ def filter_keys(
     course: str | object = ALL,
     room: str | object = ALL,
     time_slot: str | object = ALL,
-    predicate: Optional[Callable[[str, str, str], bool]] = None
+    predicate: Optional[Callable[[str, str, str], bool]] = None,
+    index: Optional['KeyIndex'] = None
 ) -> list[Tuple[str, str, str]]:
     """
     Filter scheduling keys by exact values or custom predicate.
@@ -36,10 +42,19 @@ def filter_keys(
         time_slot: Exact time slot to match, or ALL to match all time slots
         predicate: Custom function (course, room, time_slot) -> bool
                    If provided, overrides exact matching parameters
+        index: Optional KeyIndex over the same keys; exact-match lookups
+               then run in O(result size) instead of scanning
 
     Returns:
         Filtered list of keys matching the criteria
 
+    Note:
+        This is the index-free fallback path and scans the whole iterable.
+        When a scheduler with a built problem is at hand, prefer
+        InstructorScheduler._filter_keys, which serves exact matches from
+        the prebuilt indexes and narrows predicate scans to the smallest
+        indexed subset.
+
     Examples:
         # Match all rooms/times for a specific course
         filter_keys(keys, course='DEPT-2402-001')
@@ -57,31 +72,116 @@ def filter_keys(
     if predicate is not None:
         return [k for k in keys if predicate(k[0], k[1], k[2])]
 
-    # Build filter function from exact match criteria
-    def matches(c: str, r: str, t: str) -> bool:
-        if course is not ALL and c != course:
-            return False
-        if room is not ALL and r != room:
-            return False
-        if time_slot is not ALL and t != time_slot:
-            return False
-        return True
+    if index is not None:
+        return index.lookup(course=course, room=room, time_slot=time_slot)
+
+    # Dispatch once on which fields are constrained so the scan does only
+    # the comparisons that matter, instead of re-testing each field
+    # against ALL for every key
+    want_course = course is not ALL
+    want_room = room is not ALL
+    want_time = time_slot is not ALL
+    if want_course and want_room and want_time:
+        target = (course, room, time_slot)
+        return [k for k in keys if k == target]
+    if want_course and want_room:
+        return [k for k in keys if k[0] == course and k[1] == room]
+    if want_course and want_time:
+        return [k for k in keys if k[0] == course and k[2] == time_slot]
+    if want_room and want_time:
+        return [k for k in keys if k[1] == room and k[2] == time_slot]
+    if want_course:
+        return [k for k in keys if k[0] == course]
+    if want_room:
+        return [k for k in keys if k[1] == room]
+    if want_time:
+        return [k for k in keys if k[2] == time_slot]
+    return list(keys)
+
+
+class KeyIndex:
+    """
+    Inverted indexes over a list of (course, room, time_slot) keys.
+
+    Built in one pass over the keys; every exact-match combination of the
+    three fields then resolves through a prebuilt dict in O(result size).
+    The scheduler builds one of these in setup_problem, but the class is
+    self-contained so any key list can be indexed.
+    """
 
-    return [k for k in keys if matches(k[0], k[1], k[2])]
+    def __init__(self, keys: Iterable[Tuple[str, str, str]]):
+        self.keys = list(keys)
+        self.by_course = defaultdict(list)
+        self.by_room = defaultdict(list)
+        self.by_time_slot = defaultdict(list)
+        self.by_course_room = defaultdict(list)
+        self.by_course_time = defaultdict(list)
+        self.by_room_time = defaultdict(list)
+        for k in self.keys:
+            course, room, t = k
+            self.by_course[course].append(k)
+            self.by_room[room].append(k)
+            self.by_time_slot[t].append(k)
+            self.by_course_room[(course, room)].append(k)
+            self.by_course_time[(course, t)].append(k)
+            self.by_room_time[(room, t)].append(k)
+
+    def lookup(
+        self,
+        course: str | object = ALL,
+        room: str | object = ALL,
+        time_slot: str | object = ALL
+    ) -> list[Tuple[str, str, str]]:
+        """
+        Return a fresh list of the keys matching the given exact criteria.
+
+        Always a copy, never the internal index lists, so callers may
+        sort or mutate the result without corrupting the index.
+        """
+        if course is not ALL:
+            if room is not ALL:
+                keys = self.by_course_room.get((course, room), ())
+                if time_slot is not ALL:
+                    return [k for k in keys if k[2] == time_slot]
+                return list(keys)
+            if time_slot is not ALL:
+                return list(self.by_course_time.get((course, time_slot), ()))
+            return list(self.by_course.get(course, ()))
+        if room is not ALL:
+            if time_slot is not ALL:
+                return list(self.by_room_time.get((room, time_slot), ()))
+            return list(self.by_room.get(room, ()))
+        if time_slot is not ALL:
+            return list(self.by_time_slot.get(time_slot, ()))
+        return list(self.keys)
 
 
 class InstructorScheduler:
-    def __init__(self, solver_verbose: bool = False):
+    def __init__(self, solver_verbose: bool = False, solver: str = 'auto',
+                 overlap_buffer_minutes: int = 15):
         """
         Initialize the instructor scheduler.
 
         Args:
             solver_verbose: If True, display solver output during optimization.
                            If False (default), solver runs silently.
+            solver: Which solver family _make_solver should produce:
+                    'auto' (default) prefers HiGHS and falls back to CBC,
+                    'highs' requires HiGHS, 'cbc' forces CBC.
+            overlap_buffer_minutes: Minutes before a slot's start during
+                    which an earlier slot still counts as overlapping, used
+                    by the precomputed overlap relation (default 15).
         """
+        if solver not in ('auto', 'highs', 'cbc'):
+            raise ValueError(f"Unknown solver '{solver}'; expected 'auto', 'highs', or 'cbc'")
         self.time_slots_df = None
         self._constraints = []
         self.solver_verbose = solver_verbose
+        self.solver = solver
+        self.overlap_buffer_minutes = overlap_buffer_minutes
+        self._overlap_pred_cache = {}
+        self._problem_built = False
+        self._last_solution = None
 
     def add_constraints(self, constraints: List[ConstraintBase]):
         """
@@ -102,17 +202,21 @@ class InstructorScheduler:
             if not isinstance(constraint, ConstraintBase):
                 raise TypeError(f"Expected ConstraintBase instance, got {type(constraint).__name__}")
             self._constraints.append(constraint)
+        # New constraints invalidate an already-built problem
+        self._problem_built = False
         print(f"Added {len(constraints)} constraint(s)")
 
     def load_rooms(self, filename: str = 'rooms.csv'):
         """Load room data from CSV file."""
         try:
             self.rooms_df = pd.read_csv(filename)
+            self._problem_built = False
 
             # Check for duplicate rooms
             rooms = self.rooms_df['Room']
-            if len(rooms) != len(rooms.unique()):
-                duplicates = rooms[rooms.duplicated()].unique()
+            dup_mask = rooms.duplicated()
+            if dup_mask.any():
+                duplicates = rooms[dup_mask].unique()
                 raise ValueError(f"Duplicate rooms found: {list(duplicates)}")
 
             print(f"Loaded {len(self.rooms_df)} rooms from {filename}")
@@ -128,11 +232,13 @@ class InstructorScheduler:
         """Load course data from CSV file."""
         try:
             self.courses_df = pd.read_csv(filename)
+            self._problem_built = False
             
             # Check for duplicate courses
             courses = self.courses_df['Course']
-            if len(courses) != len(courses.unique()):
-                duplicates = courses[courses.duplicated()].unique()
+            dup_mask = courses.duplicated()
+            if dup_mask.any():
+                duplicates = courses[dup_mask].unique()
                 raise ValueError(f"Duplicate courses found: {list(duplicates)}")
             
             print(f"Loaded {len(self.courses_df)} courses from {filename}")
@@ -148,11 +254,13 @@ class InstructorScheduler:
         """Load time slot data from CSV file."""
         try:
             self.time_slots_df = pd.read_csv(filename)
+            self._problem_built = False
 
             # Check for duplicate time slots
             slots = self.time_slots_df['Slot']
-            if len(slots) != len(slots.unique()):
-                duplicates = slots[slots.duplicated()].unique()
+            dup_mask = slots.duplicated()
+            if dup_mask.any():
+                duplicates = slots[dup_mask].unique()
                 raise ValueError(f"Duplicate time slots found: {list(duplicates)}")
 
             print(f"Loaded {len(self.time_slots_df)} time slots from {filename}")
@@ -164,31 +272,163 @@ class InstructorScheduler:
             print(f"Error loading time slots: {e}")
             return None
 
-    def make_overlap_predicate(self, time_slot: str, room: str | object = ALL, buffer_minutes: int = 15) -> Callable[[str, str, str], bool]:
+    def keys_for(self, course: str | object = ALL, room: str | object = ALL, time_slot: str | object = ALL) -> list[Tuple[str, str, str]]:
+        """
+        Look up keys matching exact criteria using the prebuilt indexes.
+
+        Equivalent to filter_keys(self.keys, ...) for exact matches, but
+        O(result size) instead of a linear scan over all keys. Requires
+        setup_problem() to have built the indexes.
+
+        Args:
+            course: Exact course name to match, or ALL to match all courses
+            room: Exact room name to match, or ALL to match all rooms
+            time_slot: Exact time slot to match, or ALL to match all time slots
+
+        Returns:
+            List of matching (course, room, time_slot) keys
+        """
+        return self.key_index.lookup(course=course, room=room, time_slot=time_slot)
+
+    def _filter_keys(
+        self,
+        course: str | object = ALL,
+        room: str | object = ALL,
+        time_slot: str | object = ALL,
+        predicate: Optional[Callable[[str, str, str], bool]] = None
+    ) -> list[Tuple[str, str, str]]:
+        """
+        Index-backed counterpart of the free filter_keys function.
+
+        Exact-match criteria are served straight from the prebuilt indexes
+        via keys_for; a predicate, when given, is then applied only to that
+        already-narrowed subset rather than to every key. Note this differs
+        from the free function, where a predicate replaces the exact-match
+        criteria: here they compose. Requires setup_problem() to have built
+        the indexes.
+
+        Args:
+            course: Exact course name to match, or ALL to match all courses
+            room: Exact room name to match, or ALL to match all rooms
+            time_slot: Exact time slot to match, or ALL to match all time slots
+            predicate: Optional function (course, room, time_slot) -> bool
+                       applied after the exact-match narrowing
+
+        Returns:
+            List of matching (course, room, time_slot) keys
+        """
+        candidates = self.keys_for(course=course, room=room, time_slot=time_slot)
+        if predicate is None:
+            return candidates if isinstance(candidates, list) else list(candidates)
+        return [k for k in candidates if predicate(k[0], k[1], k[2])]
+
+    def filter_schedule_keys(
+        self,
+        course: str | object = ALL,
+        room: str | object = ALL,
+        time_slot: str | object = ALL,
+        predicate: Optional[Callable[[str, str, str], bool]] = None
+    ) -> list[Tuple[str, str, str]]:
+        """
+        Filter this scheduler's own keys, with filter_keys semantics.
+
+        Exact matches are served from the prebuilt indexes; a predicate,
+        as with the free function, replaces the exact-match criteria.
+
+        Raises:
+            RuntimeError: If the problem has not been built yet
+        """
+        if not hasattr(self, 'keys'):
+            raise RuntimeError(
+                "No scheduling keys available; call optimize_schedule() "
+                "or setup_problem() first"
+            )
+        if predicate is not None:
+            return filter_keys(self.keys, predicate=predicate)
+        return self._filter_keys(course=course, room=room, time_slot=time_slot)
+
+    def key_mask(self, course: str | object = ALL, room: str | object = ALL, time_slot: str | object = ALL) -> np.ndarray:
+        """
+        Vectorized boolean mask over keys_list matching exact criteria.
+
+        The counterpart of keys_for for callers composing NumPy masks:
+        a single branchless compare over the packed key array.
+
+        Args:
+            course: Exact course name to match, or ALL to match all courses
+            room: Exact room name to match, or ALL to match all rooms
+            time_slot: Exact time slot to match, or ALL to match all time slots
+
+        Returns:
+            Boolean NumPy array aligned with keys_list
+        """
+        query_mask, query_value = pack_query(
+            self.course_to_id[course] if course is not ALL else None,
+            self.room_to_id[room] if room is not ALL else None,
+            self.slot_to_id[time_slot] if time_slot is not ALL else None,
+        )
+        return packed_match(self.key_packed, query_mask, query_value)
+
+    def make_overlap_predicate(self, time_slot: str, room: str | object = ALL, buffer_minutes: Optional[int] = None) -> Callable[[str, str, str], bool]:
         """
         Create a predicate that returns True if a key overlaps with the given time slot.
 
         Args:
             time_slot: The reference time slot to check overlaps against
             room: Room to match, or ALL to match all rooms
-            buffer_minutes: Minutes before slot start to still count as overlap (default 15)
+            buffer_minutes: Minutes before slot start to still count as
+                overlap; defaults to the scheduler's overlap_buffer_minutes
         """
+        if buffer_minutes is None:
+            buffer_minutes = self.overlap_buffer_minutes
+        # The predicate depends only on its arguments and the loaded slot
+        # data, so memoize instead of allocating a fresh closure per call
+        cache_key = (time_slot, room, buffer_minutes)
+        cached = self._overlap_pred_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         t_start = self.slot_start_minutes[time_slot]
-        t_days = self.slot_days[time_slot]
+        t_bits = self.slot_day_bits[time_slot]
 
         def predicate(course: str, r: str, slot: str) -> bool:
             if room is not ALL and r != room:
                 return False
-            # Check if days overlap
-            if not self.slot_days[slot] & t_days:
+            # Check if days overlap: one integer AND on the day bitmasks
+            if not self.slot_day_bits[slot] & t_bits:
                 return False
             # Check time overlap
             slot_start = self.slot_start_minutes[slot]
             slot_end = self.slot_end_minutes[slot]
             return slot_start <= t_start and slot_end > (t_start - buffer_minutes)
 
+        self._overlap_pred_cache[cache_key] = predicate
         return predicate
 
+    def _make_solver(self):
+        """
+        Create the MILP solver to use for solving.
+
+        Honors the solver choice made at construction time: 'auto' prefers
+        HiGHS when the highs executable is available and otherwise falls
+        back to CBC configured with multithreading and presolve (markedly
+        faster than the defaults on larger models); 'highs' and 'cbc'
+        force the respective solver. HiGHS avoids much of CBC's per-solve
+        overhead, which adds up across lexicographic rounds.
+        """
+        msg = 1 if self.solver_verbose else 0
+        if self.solver in ('auto', 'highs'):
+            try:
+                highs = HiGHS_CMD(msg=bool(msg))
+                if highs.available():
+                    return highs
+            except Exception:
+                if self.solver == 'highs':
+                    raise
+            if self.solver == 'highs':
+                raise RuntimeError("solver='highs' requested but the highs executable is not available")
+        return PULP_CBC_CMD(msg=msg, threads=os.cpu_count(), presolve=True, cuts=True, strong=5)
+
     def setup_problem(self):
         """
         Set up the ILP problem with variables and constraints.
@@ -197,7 +437,13 @@ class InstructorScheduler:
         making variables and constraints available for objective evaluation.
 
         Should be called before optimize_schedule() or lexicographic_optimize().
+        Idempotent: once built, repeated calls return immediately until the
+        input data or constraint list changes, so optimize_schedule() and
+        lexicographic_optimize() can share one problem without rebuilding
+        every variable and constraint.
         """
+        if self._problem_built:
+            return True
         if self.rooms_df is None or self.courses_df is None:
             print("Error: Room and course data must be loaded first")
             return False
@@ -209,6 +455,10 @@ class InstructorScheduler:
         # Create the constraint satisfaction problem
         self.prob = LpProblem("Instructor_Scheduling", LpMinimize)
 
+        # Cached overlap predicates close over slot data, so drop them
+        # whenever the problem is rebuilt
+        self._overlap_pred_cache = {}
+
         # Extract input parameters (store as instance variables for objectives)
         self.courses = list(self.courses_df['Course'])
         self.rooms = list(self.rooms_df['Room'])
@@ -216,70 +466,269 @@ class InstructorScheduler:
         self.instructors = list(self.courses_df['Instructor'].unique())
 
         # Create dictionaries for enrollments and capacities
-        self.enrollments = dict(zip(self.courses_df['Course'], self.courses_df['Enrollment']))
-        self.capacities = dict(zip(self.rooms_df['Room'], self.rooms_df['Capacity']))
+        self.enrollments = self.courses_df.set_index('Course')['Enrollment'].to_dict()
+        self.capacities = self.rooms_df.set_index('Room')['Capacity'].to_dict()
+
+        # Map each course to its instructor for O(1) lookups (objectives
+        # previously re-filtered courses_df for every key they examined)
+        self.course_instructor = self.courses_df.set_index('Course')['Instructor'].to_dict()
+
+        # Sparse view of the instructor/course relation: the set of courses
+        # each instructor teaches, grouped in one pandas pass
+        self.courses_by_instructor = (
+            self.courses_df.groupby('Instructor')['Course'].apply(set).to_dict()
+        )
 
         # Create dictionaries for course and time slot types
-        self.course_types = dict(zip(self.courses_df['Course'], self.courses_df['Type']))
-        self.slot_types = dict(zip(self.time_slots_df['Slot'], self.time_slots_df['Type']))
-
-        # Create matrix a; a[(instructor, course)] = 1 if instructor teaches course
-        self.a = {}
-        for instructor in self.instructors:
-            for course in self.courses:
-                if instructor in self.courses_df[self.courses_df['Course'] == course]['Instructor'].values:
-                    self.a[(instructor, course)] = 1
-                else:
-                    self.a[(instructor, course)] = 0
+        self.course_types = self.courses_df.set_index('Course')['Type'].to_dict()
+        self.slot_types = self.time_slots_df.set_index('Slot')['Type'].to_dict()
 
         # Create binary decision variables using LpVariable.dicts
         # x[(course, room, time)] = 1 if course is assigned to room at time slot
         # Only create variables where course type matches time slot type
-        self.keys = set([
-            (course, room, t)
-            for course in self.courses
-            for room in self.rooms
-            for t in self.time_slots
-            if self.course_types[course] == self.slot_types[t]
-        ])
-        self.x = LpVariable.dicts("x", list(self.keys), cat='Binary')
-
-        # Create dictionaries for time slot start and end times (in minutes)
-        self.slot_start_minutes = {
-            slot: time_to_minutes(start)
-            for slot, start in zip(self.time_slots_df['Slot'], self.time_slots_df['Start'])
+        # Vectorized type matching: one outer equality over the course and
+        # slot type arrays replaces the dict lookup + compare per element
+        # of the courses x rooms x time_slots product
+        course_types_arr = self.courses_df['Type'].to_numpy()
+        slot_types_arr = self.time_slots_df['Type'].to_numpy()
+        ci, si = np.where(course_types_arr[:, None] == slot_types_arr[None, :])
+        # Rooms a course can never fit in yield variables that presolve has
+        # to discover are dead; prune them here instead. One broadcast
+        # compare of the enrollment and capacity columns gives each
+        # course's feasible rooms.
+        enroll_arr = self.courses_df['Enrollment'].to_numpy()
+        cap_arr = self.rooms_df['Capacity'].to_numpy()
+        fits = enroll_arr[:, None] <= cap_arr[None, :]
+        feasible_rooms = {
+            course: [self.rooms[j] for j in np.flatnonzero(fits[i])]
+            for i, course in enumerate(self.courses)
         }
-        self.slot_end_minutes = {
-            slot: time_to_minutes(end)
-            for slot, end in zip(self.time_slots_df['Slot'], self.time_slots_df['End'])
+        for course, rooms in feasible_rooms.items():
+            if not rooms:
+                print(f"Warning: no room is large enough for {course} "
+                      f"(enrollment {self.enrollments[course]}); it cannot be scheduled")
+        # Stable list rather than a set: iteration order is deterministic
+        # across runs (so solver input and solutions are reproducible) and
+        # positions double as integer key ids for the columnar views below
+        self.keys = [
+            (self.courses[c], room, self.time_slots[t])
+            for c, t in zip(ci, si)
+            for room in feasible_rooms[self.courses[c]]
+        ]
+        self.key_to_idx = {k: i for i, k in enumerate(self.keys)}
+        # Construct the variables directly with integer-suffix names;
+        # LpVariable.dicts would format each key tuple into the name, which
+        # is pure string-building overhead at this scale and makes the LP
+        # file needlessly large
+        self.x = {
+            k: LpVariable(f"x_{i}", cat=LpBinary) for i, k in enumerate(self.keys)
         }
+
+        # Build inverted indexes over the key set so constraints and
+        # objectives can look up matching keys directly instead of
+        # linearly scanning all of self.keys for every constraint. The
+        # keys_by_* attributes alias the index's dicts for existing callers.
+        self.key_index = KeyIndex(self.keys)
+        self.keys_by_course = self.key_index.by_course
+        self.keys_by_room = self.key_index.by_room
+        self.keys_by_time_slot = self.key_index.by_time_slot
+        self.keys_by_course_room = self.key_index.by_course_room
+        self.keys_by_course_time = self.key_index.by_course_time
+        self.keys_by_room_time = self.key_index.by_room_time
+
+        # Time slot start and end times in minutes since midnight. The
+        # HH:MM strings are bulk-parsed with pd.to_datetime rather than a
+        # Python-level time_to_minutes call per slot
+        start_dt = pd.to_datetime(self.time_slots_df['Start'], format='%H:%M')
+        end_dt = pd.to_datetime(self.time_slots_df['End'], format='%H:%M')
+        start_min = (start_dt.dt.hour * 60 + start_dt.dt.minute).to_numpy(np.int32)
+        end_min = (end_dt.dt.hour * 60 + end_dt.dt.minute).to_numpy(np.int32)
+        self.slot_start_minutes = dict(zip(self.time_slots, start_min.tolist()))
+        self.slot_end_minutes = dict(zip(self.time_slots, end_min.tolist()))
         self.slot_days = {
-            slot: set(expand_days(days))
+            slot: expand_days(days)
             for slot, days in zip(self.time_slots_df['Slot'], self.time_slots_df['Days'])
         }
+        # Day sets folded into integer bitmasks; overlap tests become one AND
+        self.slot_day_bits = {
+            slot: days_to_bits(self.slot_days[slot]) for slot in self.time_slots
+        }
+
+        # Slot start/end minutes as arrays aligned with self.time_slots;
+        # per-key time columns are gathered from these shared arrays so
+        # every objective reads the same precomputed data
+        n_slots = len(self.time_slots)
+        self.slot_start_min_arr = start_min
+        self.slot_end_min_arr = end_min
+
+        # Precompute, for each reference slot t, the slots that overlap it
+        # (same semantics as make_overlap_predicate with the configured
+        # buffer). The whole relation comes out of one vectorized pass over
+        # the day-bitmask and interval arrays instead of a pairwise Python
+        # loop doing set intersections.
+        day_bits_arr = np.fromiter(
+            (self.slot_day_bits[t] for t in self.time_slots), dtype=np.uint8, count=n_slots
+        )
+        self.overlap_slot_mask = slot_overlap_matrix(
+            self.slot_start_min_arr, self.slot_end_min_arr, day_bits_arr,
+            self.overlap_buffer_minutes,
+        )
+        self.overlapping_slots = {
+            t: [self.time_slots[j] for j in np.flatnonzero(self.overlap_slot_mask[i])]
+            for i, t in enumerate(self.time_slots)
+        }
+
+        # Columnar (structure-of-arrays) view of the key set so objectives
+        # can filter keys with a vectorized NumPy mask instead of a Python
+        # predicate call per key
+        self.keys_list = self.keys
+        self.x_arr = np.array([self.x[k] for k in self.keys_list], dtype=object)
+        self.key_course = np.array([k[0] for k in self.keys_list], dtype=object)
+        self.key_room = np.array([k[1] for k in self.keys_list], dtype=object)
+        self.key_time_slot = np.array([k[2] for k in self.keys_list], dtype=object)
+        self.key_instructor = np.array(
+            [self.course_instructor[k[0]] for k in self.keys_list], dtype=object
+        )
+        self.key_course_type = np.array(
+            [self.course_types[k[0]] for k in self.keys_list], dtype=object
+        )
+
+        # Index keys by (instructor, time_slot) so the instructor overlap
+        # constraint can gather an instructor's candidate keys per slot
+        # directly; per-instructor filtering elsewhere goes through the
+        # key_instructor columnar mask
+        self.keys_by_instructor_time = defaultdict(list)
+        for k in self.keys:
+            instructor = self.course_instructor[k[0]]
+            self.keys_by_instructor_time[(instructor, k[2])].append(k)
+
+        # Integer-encoded key columns for the compiled filter kernels in
+        # _fast_filter; ids index into self.courses/rooms/time_slots
+        self.course_to_id = {c: i for i, c in enumerate(self.courses)}
+        self.room_to_id = {r: i for i, r in enumerate(self.rooms)}
+        self.slot_to_id = {t: i for i, t in enumerate(self.time_slots)}
+        n_keys = len(self.keys_list)
+        self.key_course_id = np.fromiter(
+            (self.course_to_id[k[0]] for k in self.keys_list), dtype=np.int32, count=n_keys
+        )
+        self.key_room_id = np.fromiter(
+            (self.room_to_id[k[1]] for k in self.keys_list), dtype=np.int32, count=n_keys
+        )
+        self.key_slot_id = np.fromiter(
+            (self.slot_to_id[k[2]] for k in self.keys_list), dtype=np.int32, count=n_keys
+        )
+
+        # SWAR-packed key ids (20 bits per field), so exact-match queries
+        # reduce to one masked compare per key over a contiguous array
+        self.key_packed = pack_keys(self.key_course_id, self.key_room_id, self.key_slot_id)
+
+        # Per-key slot start minutes, one gather from the shared slot
+        # array, so the time comparisons in objectives are a single
+        # vectorized pass with no dict lookups
+        self.key_slot_start = self.slot_start_min_arr[self.key_slot_id]
+
+        # Fully materialized overlap keys per (room, reference slot), so
+        # the room overlap constraint is a plain dict lookup per row
+        self.overlap_keys_by_room_time = defaultdict(list)
+        for t in self.time_slots:
+            for ts in self.overlapping_slots[t]:
+                for k in self.keys_by_time_slot[ts]:
+                    self.overlap_keys_by_room_time[(k[1], t)].append(k)
 
         # Apply user-defined constraints
         if not self._constraints:
             print("Warning: No constraints added. Schedule may be invalid.")
             print("Consider adding: CourseAssignment(), InstructorNoOverlap(), RoomNoOverlap(), RoomCapacity()")
         else:
+            # Build parallel-safe constraint blocks concurrently; they only
+            # read scheduler state, so the blocks are independent. The
+            # problem itself is extended sequentially below.
+            built = {}
+            parallel = [c for c in self._constraints if c.parallel_safe]
+            if len(parallel) > 1:
+                with ThreadPoolExecutor() as executor:
+                    futures = [(c, executor.submit(c.build, self)) for c in parallel]
+                    built = {c: f.result() for c, f in futures}
+
             total_constraints = 0
             for constraint in self._constraints:
-                count = constraint.apply(self)
+                block = built.get(constraint)
+                if block is not None:
+                    self.prob.extend(block)
+                    count = len(block)
+                else:
+                    count = constraint.apply(self)
                 print(f"  Applied: {constraint.name} ({count} constraints)")
                 total_constraints += count
             print(f"Total: {total_constraints} constraints applied")
 
+        self._problem_built = True
         return True
 
-    def optimize_schedule(self):
-        """Solve the instructor scheduling problem using integer linear programming."""
+    def _clear_solve_artifacts(self):
+        """
+        Remove leftovers a previous solve deposited in the reused problem.
+
+        An objective-less solve makes PuLP register its fixed __dummy
+        variable in the problem; on the next solve with a real objective
+        it would be written as a bounds-only column with no COLUMNS
+        entry, which CBC rejects. Lexicographic rounds also leave their
+        lock_objective_* rows behind, which would pin a later run to the
+        previous run's objective list (or collide with its names).
+        Harmless on a freshly built problem.
+        """
+        # PuLP has no public API for unregistering a variable or removing
+        # a constraint, so the removals below poke the private registries
+        # directly; re-verify them on any PuLP version bump
+        dummy = self.prob.dummyVar
+        if dummy is not None and dummy in self.prob._variables:
+            self.prob._variables.remove(dummy)
+            self.prob._variable_ids.pop(id(dummy), None)
+        # prob.constraints() is the forward-compatible list accessor; the
+        # dict-mapping view of prob.constraints is deprecated in PuLP 3.3
+        stale_locks = [con.name for con in self.prob.constraints()
+                       if con.name.startswith('lock_objective_')]
+        for name in stale_locks:
+            del self.prob._constraints[name]
+
+    def optimize_schedule(self, solver=None, row_generation=False, max_rounds=20,
+                          warm_start: bool = True):
+        """
+        Solve the instructor scheduling problem using integer linear programming.
+
+        Args:
+            solver: Optional PuLP solver instance; defaults to HiGHS when
+                    available, otherwise multithreaded CBC
+            row_generation: If True, start from only the constraints that
+                    cannot be generated lazily and add violated rows from
+                    the remaining constraints round by round. Most conflict
+                    and capacity rows are never binding, so the solver sees
+                    a much smaller model on constraint-dominated inputs.
+            max_rounds: Safety cap on row generation rounds
+            warm_start: If True (default) and a previous solve on this
+                    scheduler succeeded, feed that solution to the solver
+                    as a MIP start — after small data or constraint tweaks
+                    it is usually feasible or near-feasible, so the search
+                    starts from a good incumbent instead of from scratch
+        """
+        if solver is None:
+            solver = self._make_solver()
+
+        if row_generation:
+            return self._optimize_row_generation(solver, max_rounds)
+
         # Set up problem
         if not self.setup_problem():
             return None
+        self._clear_solve_artifacts()
+
+        if warm_start and self._last_solution is not None:
+            chosen = self._last_solution
+            for k, var in self.x.items():
+                var.setInitialValue(1 if k in chosen else 0)
+            solver.optionsDict['warmStart'] = True
 
         # Solve the problem
-        solver = PULP_CBC_CMD(msg=1 if self.solver_verbose else 0)
         self.prob.solve(solver)
 
         # Check if the problem is solved
@@ -292,27 +741,106 @@ class InstructorScheduler:
         self._extract_schedule()
         return self.schedule
 
+    def _optimize_row_generation(self, solver, max_rounds):
+        """
+        Solve by row generation: build the problem with only the eager
+        constraints, then repeatedly solve and append just the violated
+        rows from the row-generation-capable constraints until the
+        incumbent satisfies all of them.
+        """
+        lazy = [c for c in self._constraints if c.supports_row_generation]
+        eager = [c for c in self._constraints if not c.supports_row_generation]
+        saved = self._constraints
+        self._constraints = eager
+        self._problem_built = False
+        try:
+            ok = self.setup_problem()
+        finally:
+            self._constraints = saved
+        if not ok:
+            return None
+        # Whatever rows this run ends up adding, the problem is built from
+        # the eager constraints only; leave it marked unbuilt so the next
+        # solve through any entry point rebuilds the full model instead of
+        # silently reusing the relaxed one
+        self._problem_built = False
+
+        for round_no in range(1, max_rounds + 1):
+            self.prob.solve(solver)
+            if LpStatus[self.prob.status] != 'Optimal':
+                print("No solution found")
+                self.schedule = None
+                return None
+
+            # Violation oracle: rebuild each lazy block and keep only the
+            # rows the incumbent breaks that are not in the problem yet
+            violated = {}
+            present = {con.name for con in self.prob.constraints()}
+            for constraint in lazy:
+                for name, con in constraint.build(self).items():
+                    if name not in present and not con.valid(1e-6):
+                        violated[name] = con
+            if not violated:
+                print(f"Row generation converged after {round_no} round(s)")
+                break
+            print(f"  Round {round_no}: adding {len(violated)} violated constraint(s)")
+            self.prob.extend(violated)
+            # The incumbent is a good starting point for the tightened model
+            for v in self.prob.variables():
+                if v.varValue is not None:
+                    v.setInitialValue(round(v.varValue))
+            solver.optionsDict['warmStart'] = True
+        else:
+            # Feasibility-only models can bounce between arbitrary solutions
+            # indefinitely; fall back to the full model for a final solve
+            print(f"Row generation did not converge within {max_rounds} rounds; "
+                  "adding all remaining rows")
+            remaining = {}
+            present = {con.name for con in self.prob.constraints()}
+            for constraint in lazy:
+                for name, con in constraint.build(self).items():
+                    if name not in present:
+                        remaining[name] = con
+            self.prob.extend(remaining)
+            self.prob.solve(solver)
+            if LpStatus[self.prob.status] != 'Optimal':
+                print("No solution found")
+                self.schedule = None
+                return None
+
+        self._extract_schedule()
+        return self.schedule
+
     def _extract_schedule(self):
         """Extract schedule from solved problem into a DataFrame."""
-        schedule_data = []
-        for k in self.keys:
-            if self.x[k].varValue == 1:
-                course, room, t = k
-                slot_info = self.time_slots_df[self.time_slots_df['Slot'] == t].iloc[0]
-                course_info = self.courses_df[self.courses_df['Course'] == course].iloc[0]
-                schedule_data.append({
-                    'Course': course,
-                    'Room': room,
-                    'Days': slot_info['Days'],
-                    'Start': slot_info['Start'],
-                    'End': slot_info['End'],
-                    'Instructor': course_info['Instructor'],
-                    'Enrollment': course_info['Enrollment'],
-                    'Note': course_info.get('Note', '')
-                })
-        self.schedule = pd.DataFrame(schedule_data)
-
-    def lexicographic_optimize(self, objectives: List[ObjectiveBase]):
+        # Pull every varValue into one float array and threshold it; the
+        # comparison is > 0.5 rather than == 1 because solvers report
+        # binaries as floats with round-off (e.g. 0.9999999)
+        vals = np.fromiter(
+            (self.x[k].varValue or 0.0 for k in self.keys),
+            dtype=np.float64, count=len(self.keys)
+        )
+        assigned = [self.keys[i] for i in np.flatnonzero(vals > 0.5)]
+        # Remember the incumbent so later solves on this scheduler can be
+        # warm-started from it
+        self._last_solution = set(assigned)
+        df = pd.DataFrame(assigned, columns=['Course', 'Room', 'Slot'])
+        # Join the slot and course attributes on with two vectorized merges
+        # rather than per-row dict lookups
+        course_cols = ['Course', 'Instructor', 'Enrollment']
+        if 'Note' in self.courses_df.columns:
+            course_cols.append('Note')
+        df = df.merge(self.time_slots_df[['Slot', 'Days', 'Start', 'End']], on='Slot')
+        df = df.merge(self.courses_df[course_cols], on='Course')
+        if 'Note' in df.columns:
+            df['Note'] = df['Note'].fillna('')
+        else:
+            df['Note'] = ''
+        self.schedule = df[['Course', 'Room', 'Days', 'Start', 'End',
+                            'Instructor', 'Enrollment', 'Note']]
+
+    def lexicographic_optimize(self, objectives: List[ObjectiveBase], solver=None,
+                               warm_start: bool = True):
         """
         Perform lexicographic optimization with ordered objectives.
 
@@ -321,6 +849,10 @@ class InstructorScheduler:
 
         Args:
             objectives: Ordered list of ObjectiveBase instances to optimize
+            solver: Optional PuLP solver instance; defaults to HiGHS when
+                    available, otherwise multithreaded CBC
+            warm_start: If True (default), prime each round after the first
+                    with the prior round's solution as a MIP start
 
         Returns:
             DataFrame with optimized schedule, or None if no solution found
@@ -336,10 +868,13 @@ class InstructorScheduler:
         # Set up problem
         if not self.setup_problem():
             return None
+        self._clear_solve_artifacts()
+
+        if solver is None:
+            solver = self._make_solver()
 
         if not objectives:
             print("Warning: No objectives specified, using constraint satisfaction only")
-            solver = PULP_CBC_CMD(msg=1 if self.solver_verbose else 0)
             self.prob.solve(solver)
             if LpStatus[self.prob.status] == 'Optimal':
                 self._extract_schedule()
@@ -351,20 +886,31 @@ class InstructorScheduler:
 
         print(f"\n=== Lexicographic Optimization: {len(objectives)} objectives ===\n")
 
-        # Create solver
-        solver = PULP_CBC_CMD(msg=1 if self.solver_verbose else 0)
+        # Evaluate and precheck every objective up front and concurrently.
+        # evaluate() only reads scheduler state, so the builds are
+        # independent, and doing them before the rounds keeps the solve
+        # loop free of expression construction entirely; precheck flags
+        # objectives that match nothing before any solver time is spent.
+        if len(objectives) > 1:
+            with ThreadPoolExecutor() as pool:
+                obj_exprs = list(pool.map(lambda o: o.precheck(self), objectives))
+        else:
+            obj_exprs = [objectives[0].precheck(self)]
 
         # Optimize each objective in order
         for i, objective in enumerate(objectives):
             print(f"[{i+1}/{len(objectives)}] Optimizing: {objective.name}")
 
+            # The prebuilt expression is reused below for the lock
+            # constraint instead of being rebuilt from scratch
+            obj_expr = obj_exprs[i]
+
             # Set objective function
             if objective.sense == 'minimize':
                 self.prob.sense = LpMinimize
-                self.prob.setObjective(objective.evaluate(self))
             else:
                 self.prob.sense = LpMaximize
-                self.prob.setObjective(objective.evaluate(self))
+            self.prob.setObjective(obj_expr)
 
             self.prob.solve(solver)
 
@@ -385,24 +931,34 @@ class InstructorScheduler:
                 tolerance = objective.tolerance
                 if objective.sense == 'minimize':
                     bound = optimal_value * (1 + tolerance)
-                    self.prob += (
-                        objective.evaluate(self) <= bound,
-                        f"lock_objective_{i}"
-                    )
+                    # Constructing the LpConstraint with rhs= directly
+                    # avoids the extra expression copy the <= operator makes
+                    self.prob.addConstraint(LpConstraint(
+                        obj_expr, sense=LpConstraintLE, rhs=bound,
+                        name=f"lock_objective_{i}"
+                    ))
                     if tolerance > 0:
                         print(f"    Constraining: value ≤ {bound:.2f} (tolerance: {tolerance*100:.1f}%)")
                     else:
                         print(f"    Constraining: value ≤ {bound:.2f}")
                 else:  # maximize
                     bound = optimal_value * (1 - tolerance)
-                    self.prob += (
-                        objective.evaluate(self) >= bound,
-                        f"lock_objective_{i}"
-                    )
+                    self.prob.addConstraint(LpConstraint(
+                        obj_expr, sense=LpConstraintGE, rhs=bound,
+                        name=f"lock_objective_{i}"
+                    ))
                     if tolerance > 0:
                         print(f"    Constraining: value ≥ {bound:.2f} (tolerance: {tolerance*100:.1f}%)")
                     else:
                         print(f"    Constraining: value ≥ {bound:.2f}")
+
+                # Prime the next round with this round's solution so the
+                # solver warm starts instead of searching from scratch
+                if warm_start:
+                    for v in self.prob.variables():
+                        if v.varValue is not None:
+                            v.setInitialValue(round(v.varValue))
+                    solver.optionsDict['warmStart'] = True
             print()
 
         # Extract final schedule
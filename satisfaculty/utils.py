@@ -17,12 +17,31 @@ def minutes_to_time(minutes):
     return f"{h:02d}:{m:02d}"
 
 
+# Precomputed expansions of the day-code strings; frozensets so callers
+# can intersect them directly without building a set per call
+_DAY_MAP = {
+    "MWF": frozenset(('M', 'W', 'F')),
+    "TTH": frozenset(('T', 'TH')),
+    "M": frozenset(('M',)),
+    "T": frozenset(('T',)),
+    "W": frozenset(('W',)),
+    "TH": frozenset(('TH',)),
+    "F": frozenset(('F',)),
+}
+
+
 def expand_days(days_str):
-    """Expand day codes to individual days. MWF -> [M, W, F], TTH -> [T, TH]"""
-    if days_str == "MWF":
-        return ['M', 'W', 'F']
-    elif days_str == "TTH":
-        return ['T', 'TH']
-    else:
-        # Single day (M, T, W, TH, F)
-        return [days_str]
+    """Expand day codes to individual days. MWF -> {M, W, F}, TTH -> {T, TH}"""
+    return _DAY_MAP.get(days_str) or frozenset((days_str,))
+
+
+# Bit per weekday so day-set intersection is a single integer AND
+DAY_BIT = {'M': 1, 'T': 2, 'W': 4, 'TH': 8, 'F': 16}
+
+
+def days_to_bits(days):
+    """Fold an iterable of day codes into a single bitmask."""
+    bits = 0
+    for d in days:
+        bits |= DAY_BIT[d]
+    return bits
@@ -8,29 +8,20 @@ import pandas as pd
 import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
 from matplotlib.patches import Rectangle
+from matplotlib.collections import PatchCollection
 from datetime import datetime, timedelta
 import numpy as np
-from .utils import time_to_minutes, minutes_to_time, expand_days
+from .utils import minutes_to_time, expand_days
 
 
 def visualize_schedule(schedule_df, rooms_df, output_file='schedule_visual.png'):
     """Create a visual grid representation of the schedule."""
 
-    # Expand schedule to have one row per day
-    schedule_expanded = []
-    for _, row in schedule_df.iterrows():
-        for day in expand_days(row['Days']):
-            schedule_expanded.append({
-                'Course': row['Course'],
-                'Room': row['Room'],
-                'Day': day,
-                'Start': row['Start'],
-                'End': row['End'],
-                'Instructor': row['Instructor'],
-                'Enrollment': row['Enrollment']
-            })
-
-    schedule_exp_df = pd.DataFrame(schedule_expanded)
+    # Expand schedule to one row per day with a vectorized explode
+    # instead of a Python loop over rows
+    schedule_exp_df = schedule_df.copy()
+    schedule_exp_df['Day'] = schedule_exp_df['Days'].map(expand_days).map(tuple)
+    schedule_exp_df = schedule_exp_df.explode('Day', ignore_index=True).drop(columns=['Days'])
 
     # Get room info with capacity
     room_capacity = dict(zip(rooms_df['Room'], rooms_df['Capacity']))
@@ -41,9 +32,12 @@ def visualize_schedule(schedule_df, rooms_df, output_file='schedule_visual.png')
     day_order = ['M', 'T', 'W', 'TH', 'F']
     days = [d for d in day_order if d in schedule_exp_df['Day'].unique()]
 
-    # Find time range
-    schedule_exp_df['StartMin'] = schedule_exp_df['Start'].apply(time_to_minutes)
-    schedule_exp_df['EndMin'] = schedule_exp_df['End'].apply(time_to_minutes)
+    # Find time range; the HH:MM columns are converted with vectorized
+    # string ops rather than a Python time_to_minutes call per row
+    starts = schedule_exp_df['Start'].str.split(':', expand=True).astype(int)
+    ends = schedule_exp_df['End'].str.split(':', expand=True).astype(int)
+    schedule_exp_df['StartMin'] = starts[0] * 60 + starts[1]
+    schedule_exp_df['EndMin'] = ends[0] * 60 + ends[1]
     min_time = schedule_exp_df['StartMin'].min()
     max_time = schedule_exp_df['EndMin'].max()
 
@@ -79,10 +73,15 @@ def visualize_schedule(schedule_df, rooms_df, output_file='schedule_visual.png')
     course_colors = {course: get_course_color(course)
                      for course in schedule_exp_df['Course'].unique()}
 
+    # O(1) room row lookup and one groupby pass instead of an index()
+    # scan per course and a boolean mask per day
+    room_to_idx = {room: i for i, room in enumerate(rooms)}
+    day_groups = dict(tuple(schedule_exp_df.groupby('Day')))
+
     for day_idx, day in enumerate(days):
         ax = axes[day_idx]
 
-        day_schedule = schedule_exp_df[schedule_exp_df['Day'] == day]
+        day_schedule = day_groups[day]
 
         # Set up the plot
         ax.set_xlim(min_time, max_time)
@@ -92,26 +91,29 @@ def visualize_schedule(schedule_df, rooms_df, output_file='schedule_visual.png')
         for i in range(len(rooms) + 1):
             ax.axhline(i - 0.5, color='gray', linewidth=0.5)
 
-        # Plot courses
-        for _, course in day_schedule.iterrows():
-            room_idx = rooms.index(course['Room'])
-            start = course['StartMin']
-            duration = course['EndMin'] - course['StartMin']
+        # Plot courses; the rectangles go into one PatchCollection so the
+        # axes register a single artist per day instead of one per course
+        patches = []
+        facecolors = []
+        for course in day_schedule.itertuples(index=False):
+            room_idx = room_to_idx[course.Room]
+            start = course.StartMin
+            duration = course.EndMin - course.StartMin
 
-            # Draw rectangle
-            rect = Rectangle((start, room_idx - 0.4), duration, 0.8,
-                            facecolor=course_colors[course['Course']],
-                            edgecolor='black', linewidth=1)
-            ax.add_patch(rect)
+            patches.append(Rectangle((start, room_idx - 0.4), duration, 0.8))
+            facecolors.append(course_colors[course.Course])
 
             # Add course text
             text_x = start + duration / 2
             text_y = room_idx
-            ax.text(text_x, text_y + 0.15, course['Course'],
+            ax.text(text_x, text_y + 0.15, course.Course,
                    ha='center', va='center', fontsize=8, weight='bold')
-            ax.text(text_x, text_y - 0.15, f"({course['Instructor']}, {int(course['Enrollment'])})",
+            ax.text(text_x, text_y - 0.15, f"({course.Instructor}, {int(course.Enrollment)})",
                    ha='center', va='center', fontsize=7)
 
+        ax.add_collection(PatchCollection(patches, facecolors=facecolors,
+                                          edgecolors='black', linewidths=1))
+
         # Draw vertical hour lines (in front of boxes)
         for hour in range(min_time // 60, max_time // 60 + 1):
             ax.axvline(hour * 60, color='gray', linewidth=0.5, alpha=0.3)
@@ -0,0 +1,13 @@
+#!/usr/bin/env python3
+"""
+Backward-compatibility shim for the old src/ layout.
+
+The implementation lives in satisfaculty.scheduler; keeping this module
+as a re-export means callers of the old import path pick up every fix
+made there instead of drifting against a duplicate copy.
+"""
+
+from satisfaculty.scheduler import ALL, InstructorScheduler, filter_keys, main
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Tests for re-solving the same scheduler through different entry points.
+"""
+
+import sys
+import os
+import tempfile
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pandas as pd
+
+from satisfaculty import (
+    InstructorScheduler,
+    AssignAllCourses,
+    NoInstructorOverlap,
+    NoRoomOverlap,
+    RoomCapacity,
+    MinimizeClassesBefore,
+    MinimizeClassesAfter,
+)
+
+
+def _make_scheduler(tmpdir):
+    """Build a scheduler over a tiny two-course catalog."""
+    courses = pd.DataFrame({
+        'Course': ['CS101', 'CS202'],
+        'Instructor': ['Alice', 'Bob'],
+        'Enrollment': [20, 30],
+        'Type': ['Lecture', 'Lecture'],
+    })
+    rooms = pd.DataFrame({
+        'Room': ['RoomA', 'RoomB'],
+        'Capacity': [25, 40],
+    })
+    time_slots = pd.DataFrame({
+        'Slot': ['MWF-0900', 'MWF-1000', 'TTH-0930'],
+        'Days': ['MWF', 'MWF', 'TTH'],
+        'Start': ['9:00', '10:00', '9:30'],
+        'End': ['9:50', '10:50', '10:45'],
+        'Type': ['Lecture', 'Lecture', 'Lecture'],
+    })
+    courses.to_csv(os.path.join(tmpdir, 'courses.csv'), index=False)
+    rooms.to_csv(os.path.join(tmpdir, 'rooms.csv'), index=False)
+    time_slots.to_csv(os.path.join(tmpdir, 'time_slots.csv'), index=False)
+
+    scheduler = InstructorScheduler()
+    scheduler.load_courses(os.path.join(tmpdir, 'courses.csv'))
+    scheduler.load_rooms(os.path.join(tmpdir, 'rooms.csv'))
+    scheduler.load_time_slots(os.path.join(tmpdir, 'time_slots.csv'))
+    scheduler.add_constraints([
+        AssignAllCourses(),
+        NoInstructorOverlap(),
+        NoRoomOverlap(),
+        RoomCapacity(),
+    ])
+    return scheduler
+
+
+def test_optimize_then_lexicographic():
+    """A feasibility solve must not break a later objective solve."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        scheduler = _make_scheduler(tmpdir)
+
+        schedule = scheduler.optimize_schedule()
+        assert schedule is not None, 'Feasibility solve should succeed'
+
+        schedule = scheduler.lexicographic_optimize([
+            MinimizeClassesBefore('10:00'),
+        ])
+        assert schedule is not None, 'Objective solve after feasibility solve should succeed'
+        assert len(schedule) == 2, f'Expected 2 assignments, got {len(schedule)}'
+    print('✓ test_optimize_then_lexicographic passed')
+
+
+def test_repeated_lexicographic():
+    """Repeated lexicographic runs must not inherit earlier lock rows."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        scheduler = _make_scheduler(tmpdir)
+        objectives = lambda: [
+            MinimizeClassesBefore('10:00'),
+            MinimizeClassesAfter('9:45'),
+        ]
+
+        first = scheduler.lexicographic_optimize(objectives())
+        assert first is not None, 'First lexicographic run should succeed'
+
+        second = scheduler.lexicographic_optimize(objectives())
+        assert second is not None, 'Second lexicographic run should succeed'
+        locks = [con.name for con in scheduler.prob.constraints()
+                 if con.name.startswith('lock_objective_')]
+        assert len(locks) == 1, f'Expected only the current run\'s lock row, got {locks}'
+    print('✓ test_repeated_lexicographic passed')
+
+
+def test_row_generation_then_full_solve():
+    """A row-generation solve must not leave a relaxed model behind."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        scheduler = _make_scheduler(tmpdir)
+
+        schedule = scheduler.optimize_schedule(row_generation=True)
+        assert schedule is not None, 'Row generation solve should succeed'
+        assert not scheduler._problem_built, \
+            'Row generation should force a rebuild before the next solve'
+
+        schedule = scheduler.lexicographic_optimize([
+            MinimizeClassesBefore('10:00'),
+        ])
+        assert schedule is not None, 'Solve after row generation should succeed'
+        overlap_rows = [con.name for con in scheduler.prob.constraints()
+                        if con.name.startswith('no_instructor_overlap_')
+                        or con.name.startswith('no_room_overlap_')]
+        assert overlap_rows, 'Rebuilt problem should contain the full overlap rows'
+    print('✓ test_row_generation_then_full_solve passed')
+
+
+def run_all_tests():
+    """Run all tests."""
+    print('Running re-solve sequence tests...\n')
+
+    test_optimize_then_lexicographic()
+    test_repeated_lexicographic()
+    test_row_generation_then_full_solve()
+
+    print('\n' + '=' * 50)
+    print('All tests passed! ✓')
+    print('=' * 50)
+
+
+if __name__ == '__main__':
+    run_all_tests()